@@ -0,0 +1,4 @@
+"""Lightweight constants shared across the package."""
+
+CONFIG_FILE = ".project-release-config.yaml"
+CONFIG_HELP = "See https://project-release.readthedocs.io for more information"
@@ -1,13 +1,14 @@
 """Pydantic helpers."""
 from typing import Any
+from typing import ClassVar
+from typing import FrozenSet
 from typing import List
 from typing import TypeVar
 from typing import Union
 
 from pydantic import BaseModel
-from pydantic import ValidationInfo
-from pydantic import field_validator
-from pydantic_core import PydanticUndefined
+from pydantic import ConfigDict
+from pydantic import model_validator
 
 T = TypeVar("T")
 Listable = Union[T, List[T]]
@@ -16,14 +17,29 @@ Listable = Union[T, List[T]]
 class UseDefaultValueModel(BaseModel):
     """Pydantic model for correct use of default values."""
 
-    @field_validator("*", mode="before")
+    model_config = ConfigDict(frozen=True)
+
+    _optional_keys: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the keys of the fields which have a default value."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._optional_keys = frozenset(
+            key
+            for name, field in cls.model_fields.items()
+            if not field.is_required()
+            for key in (name, field.alias)
+            if key is not None
+        )
+
+    @model_validator(mode="before")
     @classmethod
-    def _use_default_value_if_none(cls, data: Any, info: ValidationInfo) -> Any:
-        if (
-            info.field_name
-            and cls.model_fields[info.field_name].get_default() is not PydanticUndefined
-            and not cls.model_fields[info.field_name].is_required()
-            and data is None
-        ):
-            return cls.model_fields[info.field_name].get_default()
-        return data
+    def _use_default_value_if_none(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        return {
+            key: value
+            for key, value in data.items()
+            if value is not None or key not in cls._optional_keys
+        }
@@ -1,37 +1,26 @@
 """The command line module."""
 import argparse
+import functools
 import logging
-import pathlib
+import os
+import sys
 from typing import List
 from typing import Optional
 
-import colorlog
-
 from . import __version__
-from .config import CONFIG_FILE
-from .config import CONFIG_HELP
-from .config import parse_config
-from .config import sample_config
+from ._constants import CONFIG_FILE
+from ._constants import CONFIG_HELP
 from .error import ProjectReleaseError
-from .git import current_repo
 from .utils import log_exception
 
 logger = logging.getLogger(__name__)
 
+LOGGING_FORMAT = "%(levelname)-8s %(message)s"
+COLORED_LOGGING_FORMAT = f"%(log_color)s{LOGGING_FORMAT}"
 
-def project_release_cli(argv: Optional[List[str]] = None) -> int:
-    """Entry point for the command line.
-
-    Parameters
-    ----------
-    argv: list of str, optional
-        List of command line arguments.
 
-    Returns
-    -------
-    int
-        The value to be returned by the CLI executable.
-    """
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="project-release",
         description="A tool to help releasing projects.",
@@ -61,19 +50,45 @@ def project_release_cli(argv: Optional[List[str]] = None) -> int:
         "--sample-config", action="store_true", help=f"print a sample {CONFIG_FILE}"
     )
 
+    return parser
+
+
+def project_release_cli(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the command line.
+
+    Parameters
+    ----------
+    argv: list of str, optional
+        List of command line arguments.
+
+    Returns
+    -------
+    int
+        The value to be returned by the CLI executable.
+    """
+    parser = _build_parser()
     args = parser.parse_args(args=argv)
 
-    logging_format = "%(levelname)-8s %(message)s"
     logging_level = logging.DEBUG if args.verbose else logging.INFO
 
-    if args.color:
-        logging_handler = colorlog.StreamHandler()
-        logging_handler.setFormatter(
-            colorlog.ColoredFormatter(f"%(log_color)s{logging_format}")
-        )
-        logging.basicConfig(handlers=[logging_handler], level=logging_level)
-    else:
-        logging.basicConfig(format=logging_format, level=logging_level)
+    # logging.basicConfig() does nothing once the root logger has a handler,
+    # so only build one on the first in-process invocation.
+    if not logging.getLogger().handlers:
+        if args.color and sys.stderr.isatty():
+            import colorlog
+
+            logging_handler = colorlog.StreamHandler()
+            logging_handler.setFormatter(
+                colorlog.ColoredFormatter(COLORED_LOGGING_FORMAT)
+            )
+            logging.basicConfig(handlers=[logging_handler], level=logging_level)
+        else:
+            logging.basicConfig(format=LOGGING_FORMAT, level=logging_level)
+
+    # Imported here so that --help and --version do not load pydantic and git.
+    from .config import parse_config
+    from .config import sample_config
+    from .git import current_repo
 
     try:
         if args.sample_config:
@@ -82,8 +97,7 @@ def project_release_cli(argv: Optional[List[str]] = None) -> int:
 
         repo = current_repo()
 
-        git_dir = pathlib.Path(repo.git_dir)
-        config_file = git_dir.parent / args.config
+        config_file = os.path.join(os.path.dirname(repo.git_dir), args.config)
         config = parse_config(config_file)  # noqa: F841
 
     except (ProjectReleaseError, SystemExit) as exc:
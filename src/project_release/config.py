@@ -1,16 +1,19 @@
 """Config related code."""
+import functools
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any
-from typing import Dict
 from typing import TextIO
+from typing import Tuple
+from typing import Union
 
 import yaml
+from pydantic import Field
 from pydantic import ValidationError
-from pydantic import validate_call
 
+from ._constants import CONFIG_FILE  # noqa: F401
+from ._constants import CONFIG_HELP
 from ._pydantic import UseDefaultValueModel
 from .convention import ConventionConfig
 from .error import InvalidConfigFileError
@@ -22,21 +25,33 @@ from .utils import relative_path
 
 logger = logging.getLogger(__name__)
 
-CONFIG_FILE = ".project-release-config.yaml"
-CONFIG_HELP = "See https://project-release.readthedocs.io for more information"
+# Use the libyaml based loader and dumper when PyYAML has been built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class Config(UseDefaultValueModel):
     """Root configuration."""
 
-    convention: ConventionConfig = ConventionConfig()
+    convention: ConventionConfig = Field(default_factory=ConventionConfig)
     file: FileConfig = FileConfig()
     git: GitConfig = GitConfig()
 
 
-def parse_config(config_file: Path) -> Config:
+@functools.lru_cache(maxsize=None)
+def _default_config() -> Config:
+    return Config()
+
+
+def parse_config(config_file: Union[Path, str]) -> Config:
     """Return the configuration associated with the file.
 
+    The result is cached as long as the file is not modified, so the
+    returned object must not be mutated. A modification is detected from
+    the file inode, size and timestamps: an in-place rewrite keeping the
+    same size within the timestamp granularity of the filesystem is not
+    detected.
+
     Parameters
     ----------
     config_file
@@ -52,23 +67,38 @@ def parse_config(config_file: Path) -> Config:
     SystemExit
         If the configuration file is invalid or not found.
     """
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return _read_config(config_file)
+    return _read_config_cached(
+        os.path.abspath(config_file),
+        (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_cached(config_file: str, _stat_key: Tuple[int, ...]) -> Config:
+    return _read_config(config_file)
+
+
+def _read_config(config_file: Union[Path, str]) -> Config:
     try:
         logger.debug(f"parsing config file: {relative_path(config_file)}")
 
-        with open(config_file, encoding="utf-8") as stream:
-            data = yaml.safe_load(stream) or {}
+        text = Path(config_file).read_bytes().decode("utf-8")
+        data = yaml.load(text, Loader=_YamlLoader) if text else None  # noqa: S506
 
-        @validate_call
-        def _parse_config(data: Dict[str, Any]) -> Config:
-            return Config(**data)
+        if isinstance(data, dict) and not all(isinstance(key, str) for key in data):
+            raise InvalidConfigFileError(config_file)
 
-        config = _parse_config(data)
+        config = Config.model_validate(data or {})
 
     except FileNotFoundError:
         logger.warning(f"Configuration file not found: {relative_path(config_file)}")
         logger.info("Please use --sample-config to generate one")
         logger.info("Using the default configuration")
-        config = Config()
+        config = _default_config()
 
     except (OSError, UnicodeError) as exc:
         raise InvalidUtf8FileError(config_file) from exc
@@ -94,9 +124,10 @@ def dump_config(config: Config, stream: TextIO = sys.stdout) -> None:
         The output stream (default: ``sys.stdout``).
     """
     stream.write(f"# {CONFIG_HELP}{os.linesep}")
-    yaml.safe_dump(
+    yaml.dump(
         config.model_dump(by_alias=True),
         stream,
+        Dumper=_YamlDumper,
         default_flow_style=False,
         line_break=os.linesep,
     )
@@ -110,4 +141,4 @@ def sample_config(stream: TextIO = sys.stdout) -> None:
     stream
         The output stream (default: ``sys.stdout``).
     """
-    dump_config(Config())
+    dump_config(_default_config(), stream)
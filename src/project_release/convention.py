@@ -1,15 +1,18 @@
 """Conventions related code."""
+import functools
 import logging
 from abc import ABC
 from abc import abstractmethod
 from enum import Enum
 from typing import Any
+from typing import Dict
 from typing import Optional
 from typing import Union
 
 import pep440
 import semver
 from pydantic import BaseModel
+from pydantic import Field
 from pydantic import field_validator
 from pydantic import model_serializer
 from pydantic import validate_call
@@ -83,12 +86,7 @@ class SemverValidator(VersionValidator):
         --------
         VersionValidator.validate_version
         """
-        try:
-            semver.VersionInfo.parse(version)
-        except ValueError:
-            return f"Invalid semver version string: '{version}'"
-        else:
-            return True
+        return _validate_semver_version(version)
 
     def _serialize(self) -> str:
         return "semver"
@@ -111,14 +109,29 @@ class Pep440Validator(VersionValidator):
         --------
         VersionValidator.validate_version
         """
-        if not pep440.is_canonical(version):
-            return f"Invalid pep440 version string: '{version}'"
-        return True
+        return _validate_pep440_version(version)
 
     def _serialize(self) -> str:
         return "pep440"
 
 
+@functools.lru_cache(maxsize=512)
+def _validate_semver_version(version: str) -> Union[bool, str]:
+    try:
+        semver.VersionInfo.parse(version)
+    except ValueError:
+        return f"Invalid semver version string: '{version}'"
+    else:
+        return True
+
+
+@functools.lru_cache(maxsize=512)
+def _validate_pep440_version(version: str) -> Union[bool, str]:
+    if not pep440.is_canonical(version):
+        return f"Invalid pep440 version string: '{version}'"
+    return True
+
+
 class VersionValidatorEnum(str, Enum):
     """The available version validators."""
 
@@ -129,30 +142,33 @@ class VersionValidatorEnum(str, Enum):
     @classmethod
     def _missing_(cls, value: Any) -> Optional["VersionValidatorEnum"]:
         if isinstance(value, str):
-            value_lower = value.lower()
-            for member in cls:
-                if member.value == value_lower:
-                    return member
+            return _VERSION_VALIDATOR_NAMES.get(value.lower())
         return None
 
 
+_VERSION_VALIDATOR_NAMES: Dict[str, VersionValidatorEnum] = {
+    member.value: member for member in VersionValidatorEnum
+}
+
+
+# The validators are stateless, so a single instance of each is shared.
+_VERSION_VALIDATORS: Dict[VersionValidatorEnum, VersionValidator] = {
+    VersionValidatorEnum.ALL: AcceptAllValidator(),
+    VersionValidatorEnum.SEMVER: SemverValidator(),
+    VersionValidatorEnum.PEP440: Pep440Validator(),
+}
+
+
 class ConventionConfig(UseDefaultValueModel):
     """Convention configuration."""
 
-    version: VersionValidator = AcceptAllValidator()
+    version: VersionValidator = Field(
+        default_factory=lambda: _VERSION_VALIDATORS[VersionValidatorEnum.ALL]
+    )
 
     @field_validator("version", mode="before")
     @classmethod
     @validate_call
-    def _validate_version(
-        cls, value: Optional[VersionValidatorEnum]
-    ) -> VersionValidator:
+    def _validate_version(cls, value: VersionValidatorEnum) -> VersionValidator:
         """Validate the version field."""
-        if value is None:
-            return AcceptAllValidator()
-        version_validator = VersionValidatorEnum(value)
-        if version_validator == VersionValidatorEnum.SEMVER:
-            return SemverValidator()
-        if version_validator == VersionValidatorEnum.PEP440:
-            return Pep440Validator()
-        return AcceptAllValidator()
+        return _VERSION_VALIDATORS[value]
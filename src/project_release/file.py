@@ -17,6 +17,7 @@ from pydantic import validate_call
 
 from ._pydantic import Listable
 from ._pydantic import UseDefaultValueModel
+from .error import ProjectReleaseError
 from .error import VersionEmptyError
 from .error import VersionInconsistentError
 from .error import VersionNotFoundError
@@ -51,7 +52,7 @@ class VersionFile(ABC, BaseModel):
         versions = self.versions
         if not versions:
             raise VersionNotFoundError(self._path)
-        if not all(version == versions[0] for version in versions):
+        if len(set(versions)) > 1:
             raise VersionInconsistentError(self._path, versions)
         if versions[0] == "":
             raise VersionEmptyError(self._path)
@@ -59,6 +60,11 @@ class VersionFile(ABC, BaseModel):
 
     @version.setter
     def version(self, version: str) -> None:
+        try:
+            if self.version == version:
+                return
+        except (OSError, UnicodeError, ProjectReleaseError):
+            pass
         self._set_version(version)
 
     @abstractmethod
@@ -109,14 +115,14 @@ class FormattedVersionFile(VersionFile):
         super().__init__()
         self._path = path
         self.__fromat = fromat
-        self.__pattern = fromat % {"version": "(.*)"}
+        self.__regex = re.compile(fromat % {"version": "(.*)"})
 
     @property
     def versions(self) -> List[str]:
         """str: All the versions related to the file."""
         with open(self._path, encoding="utf-8") as stream:
             data = stream.read()
-        match = re.search(self.__pattern, data)
+        match = self.__regex.search(data)
         if match is None:
             return []
         return list(match.groups())
@@ -136,18 +142,20 @@ class EditedVersionFile(VersionFile):
         super().__init__()
         self._path = path
         self.__pattern = pattern
+        self.__regex = re.compile(pattern)
 
     @property
     def versions(self) -> List[str]:
         """str: All the versions related to the file."""
         with open(self._path, encoding="utf-8") as stream:
-            return re.findall(self.__pattern, stream.read())
+            return self.__regex.findall(stream.read())
 
     def _set_version(self, version: str) -> None:
         with open(self._path, "r+", encoding="utf-8") as stream:
             data = stream.read()
             stream.seek(0)
-            stream.write(re.sub(self.__pattern, version, data))
+            stream.write(self.__regex.sub(lambda _: version, data))
+            stream.truncate()
 
     def _serialize(self) -> Dict[str, Any]:
         return {"path": self._path, "pattern": self.__pattern}
@@ -167,22 +175,26 @@ class FileConfig(UseDefaultValueModel):
     def _validate_version(
         cls, value: Optional[Listable[VersionConfigType]]
     ) -> List[VersionFile]:
-        @validate_call
-        def parse_version_file(value: VersionConfigType) -> VersionFile:
-            if isinstance(value, str):
-                return PlainVersionFile(value)
-            if "path" not in value:
-                raise ValueError("version file must contain a path")
-            if "format" in value and "pattern" in value:
-                raise ValueError("format and pattern fields are exclusive")
-            if "format" in value:
-                return FormattedVersionFile(value["path"], value["format"])
-            if "pattern" in value:
-                return EditedVersionFile(value["path"], value["pattern"])
-            return PlainVersionFile(value["path"])
-
         if value is None:
             return []
         if isinstance(value, list):
-            return [parse_version_file(x) for x in value]
-        return [parse_version_file(value)]
+            return [_parse_version_file(x) for x in value]
+        return [_parse_version_file(value)]
+
+
+def _parse_version_file(value: VersionConfigType) -> VersionFile:
+    # The value has already been validated by FileConfig._validate_version.
+    if isinstance(value, str):
+        return PlainVersionFile(value)
+    if "path" not in value:
+        raise ValueError("version file must contain a path")
+    if "format" in value and "pattern" in value:
+        raise ValueError("format and pattern fields are exclusive")
+    try:
+        if "format" in value:
+            return FormattedVersionFile(value["path"], value["format"])
+        if "pattern" in value:
+            return EditedVersionFile(value["path"], value["pattern"])
+    except re.error as exc:
+        raise ValueError(f"invalid regular expression: {exc}") from exc
+    return PlainVersionFile(value["path"])
@@ -1,10 +1,12 @@
 """Git related code."""
 import enum
+import functools
 import logging
+import os
+from typing import TYPE_CHECKING
 from typing import List
 from typing import Optional
 
-import git
 from pydantic import Field
 from pydantic import field_validator
 from pydantic import validate_call
@@ -12,6 +14,9 @@ from pydantic import validate_call
 from ._pydantic import Listable
 from ._pydantic import UseDefaultValueModel
 
+if TYPE_CHECKING:
+    import git
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,9 +62,12 @@ class GitConfig(UseDefaultValueModel):
     tag: GitTagConfig = GitTagConfig()
 
 
-def current_repo() -> git.Repo:
+def current_repo() -> "git.Repo":
     """Return the current git repository.
 
+    The repository is opened once per working directory and ``GIT_DIR``
+    environment variable, and then reused.
+
     Returns
     -------
     git.repo.base.Repo
@@ -70,15 +78,22 @@ def current_repo() -> git.Repo:
     SystemExit
         If the git repository is invalid.
     """
+    return _open_repo(os.getcwd(), os.environ.get("GIT_DIR"))
+
+
+@functools.lru_cache(maxsize=8)
+def _open_repo(cwd: str, git_dir: Optional[str]) -> "git.Repo":
+    import git
+
     try:
-        repo = git.Repo(search_parent_directories=True)
+        repo = git.Repo(git_dir or cwd, search_parent_directories=True)
     except git.InvalidGitRepositoryError as exc:
         raise SystemExit("Not in a git repository") from exc
 
     return repo
 
 
-def local_branch_names(repo: git.Repo) -> List[str]:
+def local_branch_names(repo: "git.Repo") -> List[str]:
     """Return the local branches.
 
     Parameters
@@ -94,7 +109,7 @@ def local_branch_names(repo: git.Repo) -> List[str]:
     return [branch.name for branch in repo.heads]
 
 
-def remote_branch_names(remote: Optional[git.Remote]) -> List[str]:
+def remote_branch_names(remote: Optional["git.Remote"]) -> List[str]:
     """Return the remote branches.
 
     Parameters
@@ -109,14 +124,13 @@ def remote_branch_names(remote: Optional[git.Remote]) -> List[str]:
     """
     if remote is None:
         return []
+    prefix_len = len(f"{remote}/")
     return [
-        ref.name.replace(f"{remote}/", "")
-        for ref in remote.refs
-        if not ref.name.endswith("HEAD")
+        ref.name[prefix_len:] for ref in remote.refs if not ref.name.endswith("/HEAD")
     ]
 
 
-def repo_branch_names(repo: git.Repo, remote: Optional[git.Remote]) -> List[str]:
+def repo_branch_names(repo: "git.Repo", remote: Optional["git.Remote"]) -> List[str]:
     """Return the local and remote branches.
 
     Parameters
@@ -134,7 +148,16 @@ def repo_branch_names(repo: git.Repo, remote: Optional[git.Remote]) -> List[str]
     return list({*local_branch_names(repo), *remote_branch_names(remote)})
 
 
-def current_branch_name(repo: git.Repo) -> Optional[str]:
+def _remote_branch(
+    remote: Optional["git.Remote"], branch_name: str
+) -> Optional["git.RemoteReference"]:
+    if remote is None:
+        return None
+    name = f"{remote}/{branch_name}"
+    return next((ref for ref in remote.refs if ref.name == name), None)
+
+
+def current_branch_name(repo: "git.Repo") -> Optional[str]:
     """Return the current branch name.
 
     Parameters
@@ -167,7 +190,7 @@ class RefPosition(enum.Enum):
 
 
 def compare_ref(
-    ref: git.SymbolicReference, base_ref: git.SymbolicReference
+    ref: "git.SymbolicReference", base_ref: "git.SymbolicReference"
 ) -> RefPosition:
     """Compare a ref to a base ref and return the relative position.
 
@@ -183,9 +206,8 @@ def compare_ref(
     RefPosition
         The relative position of the ref compared to the base ref.
     """
-    repo = ref.repo
-    ahead = sum(1 for x in repo.iter_commits(f"{base_ref}..{ref}"))
-    behind = sum(1 for x in repo.iter_commits(f"{ref}..{base_ref}"))
+    counts = ref.repo.git.rev_list("--left-right", "--count", f"{base_ref}...{ref}")
+    behind, ahead = (int(count) for count in counts.split())
     if ahead > 0 and behind == 0:
         return RefPosition.AHEAD
     if ahead == 0 and behind == 0:
@@ -195,7 +217,7 @@ def compare_ref(
     return RefPosition.UNRELATED
 
 
-def update_branch(branch: git.Head, remote: git.Remote, force_update: bool) -> None:
+def update_branch(branch: "git.Head", remote: "git.Remote", force_update: bool) -> None:
     """Update a local git branch.
 
     Parameters
@@ -212,12 +234,12 @@ def update_branch(branch: git.Head, remote: git.Remote, force_update: bool) -> N
     SystemExit
         If the tracking branch is invalid or if the branch cannot be updated.
     """
-    if branch.name not in remote_branch_names(remote):
+    expected_tracking_branch = _remote_branch(remote, branch.name)
+
+    if expected_tracking_branch is None:
         logger.debug("The %s branch does not yet exist on the remote", branch)
         return
 
-    expected_tracking_branch = remote.refs[branch.name]
-
     tracking_branch = branch.tracking_branch()
 
     if tracking_branch is None:
@@ -263,8 +285,10 @@ def update_branch(branch: git.Head, remote: git.Remote, force_update: bool) -> N
 
 
 def create_branch(
-    branch_name: str, default_ref: git.SymbolicReference, remote: Optional[git.Remote]
-) -> git.Head:
+    branch_name: str,
+    default_ref: "git.SymbolicReference",
+    remote: Optional["git.Remote"],
+) -> "git.Head":
     """Create a local branch.
 
     Parameters
@@ -281,8 +305,9 @@ def create_branch(
     git.refs.head.Head
         The newly created branch.
     """
-    if remote and branch_name in remote_branch_names(remote):
-        remote_branch = remote.refs[branch_name]
+    remote_branch = _remote_branch(remote, branch_name)
+
+    if remote_branch is not None:
         new_branch = remote_branch.repo.create_head(branch_name, remote_branch)
         new_branch.set_tracking_branch(remote_branch)
     else:
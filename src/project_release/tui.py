@@ -1,18 +1,21 @@
 """Text-based user interface (TUI) related code."""
 import fnmatch
 import logging
+from typing import TYPE_CHECKING
 from typing import Callable
 from typing import List
 from typing import Optional
 from typing import Union
 
-import git
-import questionary
+if TYPE_CHECKING:
+    import git
 
 logger = logging.getLogger(__name__)
 
 
-def select_remote(repo: git.Repo, remote_name: Optional[str]) -> Optional[git.Remote]:
+def select_remote(
+    repo: "git.Repo", remote_name: Optional[str]
+) -> Optional["git.Remote"]:
     """Select the remote to use.
 
     Parameters
@@ -32,19 +35,22 @@ def select_remote(repo: git.Repo, remote_name: Optional[str]) -> Optional[git.Re
     SystemExit
         If the specified remote is invalid.
     """
-    available_remote_names = [x.name for x in repo.remotes]
+    available_remotes = {x.name: x for x in repo.remotes}
     if remote_name is not None:
-        if remote_name not in available_remote_names:
+        if remote_name not in available_remotes:
             raise SystemExit(f"Invalid remote: '{remote_name}'")
-        return repo.remote(remote_name)
-    if not available_remote_names:
+        return available_remotes[remote_name]
+    if not available_remotes:
         return None
-    if len(available_remote_names) == 1:
-        return repo.remote(available_remote_names[0])
+    if len(available_remotes) == 1:
+        return next(iter(available_remotes.values()))
+
+    import questionary
+
     selected_remote = questionary.select(
-        "Select the remote to use", choices=available_remote_names
+        "Select the remote to use", choices=list(available_remotes)
     ).unsafe_ask()
-    return repo.remote(selected_remote)
+    return available_remotes[selected_remote]
 
 
 def select_branch_name(
@@ -95,8 +101,9 @@ def select_branch_name(
         return f"Invalid branch name: '{branch_name}'"
 
     if user_branch is not None:
-        if validate_branch(user_branch) is not True:
-            raise SystemExit(validate_branch(user_branch))
+        result = validate_branch(user_branch)
+        if result is not True:
+            raise SystemExit(result)
         return user_branch
     if not pattern_branches and len(plain_branches) == 1:
         return plain_branches[0]
@@ -104,6 +111,8 @@ def select_branch_name(
     potential_branches = [b for b in repo_branches if validate_branch(b) is True]
     potential_branches = list({*potential_branches, *plain_branches})
 
+    import questionary
+
     if potential_branches:
         return questionary.autocomplete(
             f"Specify the desired {branch_description} branch",
@@ -141,9 +150,13 @@ def select_version(
         If the specified version is invalid.
     """
     if user_version is not None:
-        if validate(user_version) is not True:
-            raise SystemExit(validate(user_version))
+        result = validate(user_version)
+        if result is not True:
+            raise SystemExit(result)
         return user_version
+
+    import questionary
+
     return questionary.text(
         "Specify the desired version string", validate=validate
     ).unsafe_ask()
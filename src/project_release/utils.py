@@ -25,6 +25,8 @@ def relative_path(path: Union[Path, str]) -> Path:
     """Get the relative path from the current directory if possible."""
     if not isinstance(path, Path):
         path = Path(path)
+    if not path.is_absolute():
+        return path
     try:
         return path.relative_to(Path.cwd())
     except ValueError:
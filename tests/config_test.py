@@ -1,5 +1,6 @@
 """Test cases for the config."""
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -8,9 +9,11 @@ import yaml
 
 from project_release.config import parse_config
 from project_release.config import sample_config
+from project_release.convention import _VERSION_VALIDATORS
 from project_release.convention import AcceptAllValidator
 from project_release.convention import Pep440Validator
 from project_release.convention import SemverValidator
+from project_release.convention import VersionValidatorEnum
 from project_release.error import InvalidConfigFileError
 from project_release.file import EditedVersionFile
 from project_release.file import FormattedVersionFile
@@ -30,6 +33,30 @@ class TestConfig:
         return filename
 
 
+class TestRootConfig(TestConfig):
+    """Test cases related to the root config."""
+
+    def test_empty(self, tmp_path: Path) -> None:
+        """Test that an empty config is valid."""
+        path = tmp_path / "config.yaml"
+        path.touch()
+        config = parse_config(path)
+        assert isinstance(config.convention.version, AcceptAllValidator)
+        assert not config.file.version
+
+    def test_not_dict(self, tmp_path: Path) -> None:
+        """Test that a config not as 'dict' is invalid."""
+        path = self.write_yaml(tmp_path, ["convention", "file"])
+        with pytest.raises(InvalidConfigFileError):
+            parse_config(path)
+
+    def test_not_str_keys(self, tmp_path: Path) -> None:
+        """Test that a config with keys not as 'str' is invalid."""
+        path = self.write_yaml(tmp_path, {1: 2})
+        with pytest.raises(InvalidConfigFileError):
+            parse_config(path)
+
+
 class TestConventionConfig(TestConfig):
     """Test cases related to the 'convention' config."""
 
@@ -38,18 +65,43 @@ class TestConventionConfig(TestConfig):
         path = self.write_yaml(tmp_path, {})
         config = parse_config(path)
         assert isinstance(config.convention.version, AcceptAllValidator)
+        assert (
+            config.convention.version is _VERSION_VALIDATORS[VersionValidatorEnum.ALL]
+        )
 
     def test_no_version(self, tmp_path: Path) -> None:
         """Test that a config without 'version' is valid."""
         path = self.write_yaml(tmp_path, {"convention": {}})
         config = parse_config(path)
         assert isinstance(config.convention.version, AcceptAllValidator)
+        assert (
+            config.convention.version is _VERSION_VALIDATORS[VersionValidatorEnum.ALL]
+        )
+
+    def test_version_null(self, tmp_path: Path) -> None:
+        """Test that a config with 'version=null' is valid."""
+        path = self.write_yaml(tmp_path, {"convention": {"version": None}})
+        config = parse_config(path)
+        assert isinstance(config.convention.version, AcceptAllValidator)
+        assert (
+            config.convention.version is _VERSION_VALIDATORS[VersionValidatorEnum.ALL]
+        )
 
     def test_version_semver(self, tmp_path: Path) -> None:
         """Test that a config with 'version=semver' is valid."""
         path = self.write_yaml(tmp_path, {"convention": {"version": "semver"}})
         config = parse_config(path)
         assert isinstance(config.convention.version, SemverValidator)
+        assert (
+            config.convention.version
+            is _VERSION_VALIDATORS[VersionValidatorEnum.SEMVER]
+        )
+
+    def test_version_semver_uppercase(self, tmp_path: Path) -> None:
+        """Test that a config with 'version=SEMVER' is valid."""
+        path = self.write_yaml(tmp_path, {"convention": {"version": "SEMVER"}})
+        config = parse_config(path)
+        assert isinstance(config.convention.version, SemverValidator)
 
     def test_version_pep440(self, tmp_path: Path) -> None:
         """Test that a config with 'version=pep440' is valid."""
@@ -79,6 +131,12 @@ class TestFileConfig(TestConfig):
         config = parse_config(path)
         assert not config.file.version
 
+    def test_version_null(self, tmp_path: Path) -> None:
+        """Test that a config with 'version=null' is valid."""
+        path = self.write_yaml(tmp_path, {"file": {"version": None}})
+        config = parse_config(path)
+        assert not config.file.version
+
     def test_version(self, tmp_path: Path) -> None:
         """Test that a config with 'version' as 'str' is valid."""
         path = self.write_yaml(tmp_path, {"file": {"version": "path"}})
@@ -145,6 +203,14 @@ class TestFileConfig(TestConfig):
         assert len(config.file.version) == 1
         assert isinstance(config.file.version[0], EditedVersionFile)
 
+    def test_version_pattern_invalid(self, tmp_path: Path) -> None:
+        """Test that a config with an invalid 'pattern' is invalid."""
+        path = self.write_yaml(
+            tmp_path, {"file": {"version": {"path": "path", "pattern": "("}}}
+        )
+        with pytest.raises(InvalidConfigFileError):
+            parse_config(path)
+
     def test_version_both_format_pattern(self, tmp_path: Path) -> None:
         """Test that a config with both 'format' and 'pattern' is invalid."""
         path = self.write_yaml(
@@ -185,9 +251,52 @@ class TestFileConfig(TestConfig):
         assert isinstance(config.file.version[3], EditedVersionFile)
 
 
+class TestParseConfigCache(TestConfig):
+    """Test cases related to the parsed config cache."""
+
+    def test_cached(self, tmp_path: Path) -> None:
+        """Test that an unmodified config is only parsed once."""
+        path = self.write_yaml(tmp_path, {"convention": {"version": "semver"}})
+        assert parse_config(path) is parse_config(path)
+
+    def test_modified(self, tmp_path: Path) -> None:
+        """Test that a modified config is parsed again."""
+        path = self.write_yaml(tmp_path, {"convention": {"version": "semver"}})
+        config = parse_config(path)
+        path = self.write_yaml(tmp_path, {"convention": {"version": "all"}})
+        assert parse_config(path) is not config
+        assert isinstance(parse_config(path).convention.version, AcceptAllValidator)
+
+    def test_modified_same_size(self, tmp_path: Path) -> None:
+        """Test that a config modified in place with the same size is parsed again."""
+        path = self.write_yaml(tmp_path, {"convention": {"version": "semver"}})
+        config = parse_config(path)
+        stat = path.stat()
+        path = self.write_yaml(tmp_path, {"convention": {"version": "pep440"}})
+        assert path.stat().st_size == stat.st_size
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert parse_config(path) is not config
+        assert isinstance(parse_config(path).convention.version, Pep440Validator)
+
+    def test_replaced_same_size(self, tmp_path: Path) -> None:
+        """Test that a config replaced with the same size and mtime is parsed again."""
+        path = self.write_yaml(tmp_path, {"convention": {"version": "semver"}})
+        config = parse_config(path)
+        stat = path.stat()
+        (tmp_path / "new").mkdir()
+        new_path = self.write_yaml(
+            tmp_path / "new", {"convention": {"version": "pep440"}}
+        )
+        os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(new_path, path)
+        assert parse_config(path) is not config
+        assert isinstance(parse_config(path).convention.version, Pep440Validator)
+
+
 def test_sample_config(tmp_path: Path) -> None:
     """Test that a sample config is valid."""
     filename = tmp_path / "config.yaml"
     with open(filename, "w", encoding="utf-8") as stream:
         sample_config(stream)
+    assert filename.stat().st_size > 0
     parse_config(filename)
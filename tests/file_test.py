@@ -1,5 +1,6 @@
 """Test cases for the CLI."""
 import logging
+import os
 from pathlib import Path
 
 import pytest
@@ -26,6 +27,17 @@ class TestPlainVersionFile:
         with open(path, encoding="utf-8") as stream:
             assert stream.read() == version
 
+    def test_write_unchanged(self, tmp_path: Path) -> None:
+        """Test that a file already up to date is not write."""
+        version = "1.2.3"
+        path = tmp_path / "VERSION"
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(version)
+        os.utime(path, ns=(0, 0))
+        file = PlainVersionFile(path)
+        file.version = version
+        assert path.stat().st_mtime_ns == 0
+
     def test_read(self, tmp_path: Path) -> None:
         """Test that a valid file can be read."""
         version = "1.2.3"
@@ -167,6 +179,16 @@ class TestEditedVersionFile:
         file.version = after_version
         self.__check_version_file(path, after_version, after_version, before_version)
 
+    def test_write_shorter(self, tmp_path: Path) -> None:
+        """Test that a file can be write with a shorter version."""
+        before_version = "1.2.3-rc1"
+        after_version = "1.2.3"
+        path = tmp_path / "VERSION"
+        self.__create_version_file(path, before_version, before_version)
+        file = EditedVersionFile(path, self.PATTERN)
+        file.version = after_version
+        self.__check_version_file(path, after_version, after_version, before_version)
+
     def test_write_inconsistent(self, tmp_path: Path) -> None:
         """Test that a file with inconsistent versions can be write."""
         before_version_1 = "1.2.3"
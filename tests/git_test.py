@@ -0,0 +1,138 @@
+"""Test cases for the git helpers."""
+from pathlib import Path
+from typing import Tuple
+
+import git
+import pytest
+
+from project_release.git import RefPosition
+from project_release.git import compare_ref
+from project_release.git import create_branch
+from project_release.git import current_repo
+from project_release.git import remote_branch_names
+from project_release.git import update_branch
+
+
+class TestGit:
+    """Base class for the git test cases."""
+
+    def commit(self, repo: git.Repo, message: str) -> git.Commit:
+        """Create an empty commit on the current branch."""
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "Test")
+            config.set_value("user", "email", "test@example.com")
+        repo.git.commit("--allow-empty", "-m", message)
+        return repo.head.commit
+
+    def create_repos(self, path: Path) -> Tuple[git.Repo, git.Remote]:
+        """Create a repository cloned from an upstream with a feature branch."""
+        upstream = git.Repo.init(path / "upstream")
+        self.commit(upstream, "initial")
+        upstream.create_head("feature")
+        repo = git.Repo.clone_from(str(path / "upstream"), str(path / "repo"))
+        return repo, repo.remotes.origin
+
+
+class TestCurrentRepo(TestGit):
+    """Test cases related to the current repository."""
+
+    def test_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the repository is found from a subdirectory."""
+        repo, _ = self.create_repos(tmp_path)
+        subdir = tmp_path / "repo" / "subdir"
+        subdir.mkdir()
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.chdir(subdir)
+        assert current_repo().git_dir == repo.git_dir
+
+    def test_git_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the GIT_DIR environment variable is honored."""
+        repo, _ = self.create_repos(tmp_path)
+        upstream = git.Repo(tmp_path / "upstream")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_DIR", str(repo.git_dir))
+        assert current_repo().git_dir == repo.git_dir
+        monkeypatch.setenv("GIT_DIR", str(upstream.git_dir))
+        assert current_repo().git_dir == upstream.git_dir
+
+    def test_not_repo(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a directory outside a repository is rejected."""
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(SystemExit):
+            current_repo()
+
+
+class TestRemoteBranchNames(TestGit):
+    """Test cases related to the remote branch names."""
+
+    def test_names(self, tmp_path: Path) -> None:
+        """Test that only the leading remote name is stripped."""
+        repo, remote = self.create_repos(tmp_path)
+        upstream = git.Repo(tmp_path / "upstream")
+        upstream.create_head("feat/origin/x")
+        upstream.create_head("myHEAD")
+        remote.fetch()
+        assert "origin/HEAD" in [ref.name for ref in remote.refs]
+        names = remote_branch_names(remote)
+        assert sorted(names) == sorted(
+            [upstream.active_branch.name, "feature", "feat/origin/x", "myHEAD"]
+        )
+
+    def test_no_remote(self) -> None:
+        """Test that no remote returns no branch."""
+        assert remote_branch_names(None) == []
+
+
+class TestCompareRef(TestGit):
+    """Test cases related to the ref comparison."""
+
+    def test_positions(self, tmp_path: Path) -> None:
+        """Test the position of a ref compared to a base ref."""
+        repo, _ = self.create_repos(tmp_path)
+        base = repo.create_head("base")
+        self.commit(repo, "ahead")
+        head = repo.active_branch
+        diverged = repo.create_head("diverged", base)
+        diverged.checkout()
+        self.commit(repo, "diverged")
+        assert compare_ref(head, base) == RefPosition.AHEAD
+        assert compare_ref(base, head) == RefPosition.BEHIND
+        assert compare_ref(head, head) == RefPosition.EQUAL
+        assert compare_ref(head, diverged) == RefPosition.UNRELATED
+
+
+class TestCreateBranch(TestGit):
+    """Test cases related to the branch creation."""
+
+    def test_remote(self, tmp_path: Path) -> None:
+        """Test that a branch existing on the remote tracks it."""
+        repo, remote = self.create_repos(tmp_path)
+        branch = create_branch("feature", repo.head.commit, remote)
+        assert branch.tracking_branch() == remote.refs.feature
+
+    def test_not_remote(self, tmp_path: Path) -> None:
+        """Test that a branch missing on the remote starts at the default ref."""
+        repo, remote = self.create_repos(tmp_path)
+        branch = create_branch("new", repo.head.commit, remote)
+        assert branch.tracking_branch() is None
+        assert branch.commit == repo.head.commit
+
+    def test_not_remote_list_method(self, tmp_path: Path) -> None:
+        """Test that a missing branch named after a list method is not found."""
+        repo, remote = self.create_repos(tmp_path)
+        for name in ("index", "sort"):
+            branch = create_branch(name, repo.head.commit, remote)
+            assert branch.tracking_branch() is None
+            assert branch.commit == repo.head.commit
+
+
+class TestUpdateBranch(TestGit):
+    """Test cases related to the branch update."""
+
+    def test_not_remote_list_method(self, tmp_path: Path) -> None:
+        """Test that a branch named after a list method is left untouched."""
+        repo, remote = self.create_repos(tmp_path)
+        branch = repo.create_head("index")
+        update_branch(branch, remote, force_update=False)
+        assert branch.tracking_branch() is None